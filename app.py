@@ -9,17 +9,41 @@ within specific ranges.
 Dependencies:
 - Flask: Web framework for creating the API endpoints.
 - Flask-CORS: Middleware for handling Cross-Origin Resource Sharing.
+- Flask-Caching: Response cache for aggregate endpoints and summaries.
+- Flask-Compress: gzip compression of responses.
+- Gunicorn + gevent: Production server; gevent workers let many requests wait
+  on SQLite Cloud and OpenAI concurrently within one process.
 - SQLiteCloud: Library for connecting to SQLite Cloud.
 - OpenAI: API for generating summaries from environmental data.
-- json: Standard library for JSON operations.
+- orjson: Fast JSON encoder used by jsonify and streamed responses.
+- cachetools: TTL-bounded in-process LRU for /summarize results.
 - os: Standard library for environment variables and OS operations.
 - datetime: Standard library for date and time operations.
+- queue: Standard library queue used as a thread-safe connection pool.
 
 Environment Variables:
 - API_KEY: SQLite Cloud API key.
 - DATABASE_URL: URL for SQLite Cloud database.
 - OPENAI_API_KEY: API key for OpenAI service.
 - PORT: Port on which to run the Flask application (default: 5000).
+- WORKER_CONNECTIONS: Concurrent requests per gevent worker (default: 100).
+- DB_POOL_SIZE: Number of pooled SQLite Cloud connections (default: WORKER_CONNECTIONS).
+- DB_POOL_TIMEOUT: Seconds to wait for a free pooled connection (default: 10).
+- DB_IDLE_PING: Idle seconds after which a pooled connection is pinged (default: 30).
+- CACHE_TYPE: Flask-Caching backend, e.g. SimpleCache or RedisCache (default: SimpleCache).
+- REDIS_URL: Redis URL used when CACHE_TYPE is RedisCache.
+- CACHE_TIMEOUT: Seconds to cache aggregate responses (default: 60).
+- COALESCE_TIMEOUT: Seconds a coalesced request waits for the leader (default: 30).
+- SUMMARY_CACHE_TIMEOUT: Seconds to cache /summarize results (default: 3600).
+- SUMMARY_LRU_TTL: Seconds a worker keeps its in-process copy of a summary (default: 60).
+- ROLLUP_INTERVAL: Seconds between rollup table refreshes (default: 60).
+- MAX_RANGE_DAYS: Longest date range accepted by the range endpoints (default: 90).
+
+Rollup Tables:
+- temperature_daily and motion_hourly (see rollups.sql) hold pre-aggregated
+  sensor data. The day, week, month, hour and peak motion endpoints read from
+  them instead of the raw tables. They are created and refreshed by a single
+  `flask --app app rollups` process (the `rollups` entry in the Procfile).
 
 Routes:
 - POST /summarize: Summarizes provided environmental data using OpenAI.
@@ -66,13 +90,29 @@ Error Handling:
   and appropriate HTTP status code in case of failures or exceptions.
 """
 
-from flask import Flask, jsonify, request
+# Patch sockets before sqlitecloud/openai are imported so their network I/O
+# yields to other greenlets under Gunicorn's gevent workers.
+from gevent import monkey
+monkey.patch_all()
+
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
 import sqlitecloud
 import os
-from datetime import datetime, timedelta
+import queue
+import threading
+import time
+import functools
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from openai import OpenAI
-import json
+import hashlib
+import orjson
+from cachetools import TTLCache, cached
 
 # SQLiteCloud connection details
 API_KEY = os.getenv('API_KEY')
@@ -80,16 +120,739 @@ DATABASE_URL = os.getenv('DATABASE_URL')
 DB_NAME = 'finalProject'
 OPENAI_API_KEY= os.getenv('OPENAI_KEY')
 client = OpenAI(api_key=OPENAI_API_KEY)
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, so jsonify and request.json use it.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping decode/encode
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # This will enable CORS for all routes
+Compress(app)  # gzip/br-encode responses for clients that accept it
+
+# Aggregate results only change as new sensor rows arrive, so cache them briefly
+CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 60))
+cache = Cache(app, config={
+    'CACHE_TYPE': os.getenv('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_REDIS_URL': os.getenv('REDIS_URL'),
+    'CACHE_DEFAULT_TIMEOUT': CACHE_TIMEOUT,
+})
+
+
+def _is_cacheable(response):
+    """
+    Only cache 200 responses, so errors are recomputed on the next request.
+    """
+    return response.status_code == 200
+
+
+# Requests currently being computed, keyed by request path + query string
+_inflight = {}
+_inflight_lock = threading.Lock()
+# Seconds a coalesced request waits for the leader before running the view itself
+COALESCE_TIMEOUT = float(os.getenv('COALESCE_TIMEOUT', 30))
+
+
+def coalesce(f):
+    """
+    Collapses concurrent identical requests into a single call of the view.
+
+    The first request for a given path runs the view; requests for the same
+    path that arrive while it is still running wait for its result instead
+    of issuing the same query again. Applied above @cache.cached, so the
+    leader has stored its result in the cache before later requests stop
+    waiting on it. A follower that waits longer than COALESCE_TIMEOUT runs
+    the view itself rather than hanging on a stuck leader.
+    """
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        key = request.full_path
+        with _inflight_lock:
+            future = _inflight.get(key)
+            leader = future is None
+            if leader:
+                future = _inflight[key] = Future()
+
+        if not leader:
+            try:
+                body, status, headers = future.result(timeout=COALESCE_TIMEOUT)
+            except FutureTimeoutError:
+                return f(*args, **kwargs)
+            return Response(body, status=status, headers=headers)
+
+        try:
+            response = app.make_response(f(*args, **kwargs))
+            future.set_result((response.get_data(), response.status_code, list(response.headers)))
+            return response
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    return wrapper
+
+
+def _body_etag(response):
+    """
+    Returns the ETag value for a response: the SHA-256 of its body.
+    """
+    return hashlib.sha256(response.get_data()).hexdigest()
+
+
+def cached_response(f):
+    """
+    Caches a GET view's response for CACHE_TIMEOUT seconds (see @cache.cached).
+
+    Successful responses are tagged with their ETag before being stored, so
+    cache hits are served without re-hashing the body.
+    """
+    @functools.wraps(f)
+    def tagged(*args, **kwargs):
+        response = app.make_response(f(*args, **kwargs))
+        if response.status_code == 200:
+            response.set_etag(_body_etag(response))
+        return response
+    return cache.cached(timeout=CACHE_TIMEOUT, query_string=True,
+                        response_filter=_is_cacheable)(tagged)
 
-# Open the connection to SQLite Cloud
-try:
+
+@app.after_request
+def add_etag(response):
+    """
+    Tags successful GET responses with an ETag and answers 304 on a match.
+
+    Registered after Compress, so it runs first: the tag covers the
+    uncompressed body, and a matching request gets an empty 304 before any
+    compression work is done. Flask-Compress appends ":<encoding>" to the
+    ETag it sends, so a client's If-None-Match is compared without that
+    suffix. Streamed responses are left alone.
+    """
+    if request.method != 'GET' or response.status_code != 200 or response.is_streamed:
+        return response
+
+    etag, _ = response.get_etag()
+    if etag is None:
+        etag = _body_etag(response)
+        response.set_etag(etag)
+
+    tags = request.if_none_match.as_set(include_weak=True)
+    if request.if_none_match.star_tag:
+        tags.add(etag)
+    for tag in tags:
+        if tag.split(':', 1)[0] == etag:
+            not_modified = Response(status=304)
+            not_modified.set_etag(tag)
+            return not_modified
+    return response
+
+
+# Longest start_date/end_date span accepted by the range endpoints
+MAX_RANGE_DAYS = int(os.getenv('MAX_RANGE_DAYS', 90))
+
+# Number of SQLite Cloud connections per worker process. Defaults to the
+# gevent worker's concurrency (see Procfile) so requests never queue on it.
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', os.getenv('WORKER_CONNECTIONS', 100)))
+# Seconds a request waits for a free connection before failing
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+# Connections idle for longer than this are pinged before reuse
+DB_IDLE_PING = float(os.getenv('DB_IDLE_PING', 30))
+
+
+# Applied to every new connection so all pooled connections behave the same
+PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA optimize',
+]
+
+
+def _init_conn(connection, read_only):
+    """
+    Applies PRAGMAS to a freshly opened connection.
+
+    A tuning pragma the server refuses is logged and skipped rather than
+    failing the connection. Read-only connections also get PRAGMA
+    query_only, which makes SQLite reject any write on them. It is a safety
+    guard, not a performance setting: unlike opening the file read-only it
+    changes nothing about locking. If it cannot be confirmed the connection
+    is closed and an error raised, so the read pool never silently allows
+    writes.
+    """
+    cursor = connection.cursor()
+    for pragma in PRAGMAS:
+        try:
+            cursor.execute(pragma)
+        except Exception as e:
+            print(f"Failed to apply {pragma}: {e}")
+    if read_only:
+        try:
+            cursor.execute('PRAGMA query_only=ON')
+            cursor.execute('PRAGMA query_only')
+            row = cursor.fetchone()
+        except Exception:
+            row = None
+        if not row or str(row[0]) != '1':
+            connection.close()
+            raise RuntimeError('Could not make the SQLite Cloud connection read-only')
+    return connection
+
+
+def _connect(read_only=True):
+    """
+    Opens and initializes a new connection to SQLite Cloud.
+    """
     # Constructing the connection string
-    conn = sqlitecloud.connect(f"{DATABASE_URL}/{DB_NAME}?apikey={API_KEY}")
-    print("Connected to SQLite Cloud")
-except Exception as e:
-    print(f"Failed to connect to SQLite Cloud: {e}")
+    connection = sqlitecloud.connect(f"{DATABASE_URL}/{DB_NAME}?apikey={API_KEY}")
+    return _init_conn(connection, read_only)
+
+
+def _is_alive(connection):
+    """
+    Checks that a pooled connection can still run a trivial query.
+    """
+    try:
+        cursor = connection.cursor()
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+        return True
+    except Exception:
+        return False
+
+
+def _close_quietly(connection):
+    """
+    Closes a connection that is being discarded, ignoring errors.
+    """
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+def _open_pool(size):
+    """
+    Creates a pool of `size` connection slots.
+
+    Each slot holds a (connection, last_used) pair. Slots start empty and
+    are connected on first checkout, so a large pool costs nothing until
+    the concurrency is actually needed.
+    """
+    pool = queue.Queue()
+    for _ in range(size):
+        pool.put((None, 0.0))
+    return pool
+
+
+# Open the pools of connections to SQLite Cloud. Every route handler only
+# reads and uses query_only connections; the single writer connection is
+# used for schema setup and rollups.
+POOL = _open_pool(DB_POOL_SIZE)
+WRITE_POOL = _open_pool(1)
+
+
+@contextmanager
+def get_conn(write=False):
+    """
+    Checks a connection out of the pool for the duration of a request.
+
+    Connections come from the read-only pool unless `write` is set. Waiting
+    longer than DB_POOL_TIMEOUT for a free slot raises an error, which the
+    handler turns into a 500. A connection that sat idle for more than
+    DB_IDLE_PING seconds is pinged before reuse; recently used ones are not,
+    so the common path costs no extra round-trip. If the handler raises and
+    the socket turns out to be closed, the connection is discarded and the
+    slot reconnects on its next checkout. The slot is always returned to
+    the pool.
+    """
+    pool = WRITE_POOL if write else POOL
+    try:
+        connection, last_used = pool.get(timeout=DB_POOL_TIMEOUT)
+    except queue.Empty:
+        raise RuntimeError('Timed out waiting for a database connection') from None
+    try:
+        if connection is not None and time.monotonic() - last_used > DB_IDLE_PING:
+            if not _is_alive(connection):
+                _close_quietly(connection)
+                connection = None
+        if connection is None:
+            connection = _connect(read_only=not write)
+        yield connection
+    except Exception:
+        if connection is not None and not connection.is_connected():
+            _close_quietly(connection)
+            connection = None
+        raise
+    finally:
+        pool.put((connection, time.monotonic()))
+
+
+# Rows encoded and sent per chunk by the streaming endpoints. This batches
+# the orjson calls and the writes; it does not bound memory, because the
+# driver has already buffered the whole result set.
+STREAM_BATCH_SIZE = 500
+
+
+def _stream_rows(rows, pack):
+    """
+    Yields already-fetched rows as a JSON array, one chunk per
+    STREAM_BATCH_SIZE rows, each row converted to a dict by `pack` (see
+    make_packer).
+    """
+    yield b'['
+    for start in range(0, len(rows), STREAM_BATCH_SIZE):
+        batch = rows[start:start + STREAM_BATCH_SIZE]
+        chunk = b','.join(orjson.dumps(pack(row)) for row in batch)
+        yield chunk if start == 0 else b',' + chunk
+    yield b']'
+
+
+def stream_json(query, pack, params=()):
+    """
+    Returns a streaming JSON response for a query that may return many rows.
+
+    The sqlitecloud driver reads the whole result set while executing, so
+    the rows are fetched and the pooled connection is returned before the
+    response starts; a slow client never holds a connection. Database errors
+    therefore still propagate to the handler and become a 500. Only the JSON
+    encoding is incremental: no full list of dicts or single JSON buffer is
+    built for the response.
+    """
+    with get_conn() as conn:
+        rows = _execute(conn, query, params).fetchall()
+    return Response(stream_with_context(_stream_rows(rows, pack)),
+                    mimetype='application/json')
+
+
+# Rollup tables that back the aggregate endpoints (see rollups.sql)
+ROLLUP_SCHEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rollups.sql')
+ROLLUP_INTERVAL = int(os.getenv('ROLLUP_INTERVAL', 60))
+
+# Each refresh looks at the rows whose id is past the watermark stored in
+# rollup_state and recomputes every bucket those rows fall into, so late rows
+# with old timestamps are folded into the right day/hour. The timestamp lower
+# bound lets the recompute use idx_temp_ts/idx_motion_ts. Both statements take
+# (last_id, max_id, last_id, max_id). NULL temperatures are skipped, matching
+# AVG(temperature) over the raw table.
+ROLLUP_REFRESH = {
+    'temperature': """
+        INSERT INTO temperature_daily (date, sum_temp, n)
+        SELECT DATE(timestamp), SUM(temperature), COUNT(temperature)
+        FROM temperature
+        WHERE timestamp >= (SELECT MIN(DATE(timestamp)) FROM temperature WHERE id > ? AND id <= ?)
+          AND DATE(timestamp) IN (SELECT DATE(timestamp) FROM temperature WHERE id > ? AND id <= ?)
+          AND temperature IS NOT NULL
+        GROUP BY DATE(timestamp)
+        ON CONFLICT(date) DO UPDATE SET sum_temp = excluded.sum_temp, n = excluded.n
+    """,
+    'motion': """
+        INSERT INTO motion_hourly (hour, cnt)
+        SELECT STRFTIME('%Y-%m-%d %H', timestamp), COUNT(*)
+        FROM motion
+        WHERE timestamp >= (SELECT MIN(STRFTIME('%Y-%m-%d %H', timestamp)) FROM motion WHERE id > ? AND id <= ?)
+          AND STRFTIME('%Y-%m-%d %H', timestamp) IN (
+              SELECT STRFTIME('%Y-%m-%d %H', timestamp) FROM motion WHERE id > ? AND id <= ?)
+        GROUP BY STRFTIME('%Y-%m-%d %H', timestamp)
+        ON CONFLICT(hour) DO UPDATE SET cnt = excluded.cnt
+    """,
+}
+
+
+def create_rollups():
+    """
+    Creates the rollup tables if they do not exist yet.
+    """
+    with open(ROLLUP_SCHEMA) as f:
+        statements = [stmt.strip() for stmt in f.read().split(';')]
+    with get_conn(write=True) as conn:
+        cursor = conn.cursor()
+        for statement in statements:
+            # Skip the trailing empty chunk and comment-only chunks
+            if any(line.strip() and not line.strip().startswith('--')
+                   for line in statement.splitlines()):
+                cursor.execute(statement)
+
+
+def refresh_rollups():
+    """
+    Folds temperature and motion rows added since the last refresh into the
+    rollup tables.
+
+    The watermark only advances after the upsert succeeds, so a failed
+    refresh is simply redone on the next run.
+    """
+    with get_conn(write=True) as conn:
+        cursor = conn.cursor()
+        for table, statement in ROLLUP_REFRESH.items():
+            cursor.execute(f'SELECT MAX(id) FROM {table}')
+            max_id = cursor.fetchone()[0]
+            cursor.execute('SELECT last_id FROM rollup_state WHERE name = ?', (table,))
+            row = cursor.fetchone()
+            last_id = row[0] if row else 0
+            if max_id is None or max_id <= last_id:
+                continue
+            cursor.execute(statement, (last_id, max_id, last_id, max_id))
+            cursor.execute(
+                'INSERT INTO rollup_state (name, last_id) VALUES (?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET last_id = excluded.last_id',
+                (table, max_id),
+            )
+        # Let SQLite refresh its planner statistics after the writes
+        cursor.execute('PRAGMA optimize')
+
+
+def run_rollups():
+    """
+    Refreshes the rollups every ROLLUP_INTERVAL seconds, forever.
+
+    Runs in a single dedicated process (see the `rollups` CLI command) so
+    web workers never write and are not slowed down at boot.
+    """
+    while True:
+        try:
+            refresh_rollups()
+        except Exception as e:
+            print(f"Failed to refresh rollups: {e}")
+        time.sleep(ROLLUP_INTERVAL)
+
+
+# Indexes for the raw-table endpoints: latest/range queries seek on
+# timestamp and the peak temperature lookup reads one entry off the end.
+INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_temp_ts ON temperature(timestamp DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_motion_ts ON motion(timestamp DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_temp_val ON temperature(temperature DESC)',
+]
+
+
+def create_indexes():
+    """
+    Creates the indexes used by the raw-table endpoints if they are missing.
+    """
+    with get_conn(write=True) as conn:
+        cursor = conn.cursor()
+        for statement in INDEXES:
+            cursor.execute(statement)
+
+
+def setup_schema():
+    """
+    Creates the indexes and rollup tables if they are missing.
+    """
+    try:
+        create_indexes()
+    except Exception as e:
+        print(f"Failed to create indexes: {e}")
+
+    try:
+        create_rollups()
+    except Exception as e:
+        print(f"Failed to create rollup tables: {e}")
+
+
+@app.cli.command('rollups')
+def rollups_command():
+    """
+    Sets up the schema and keeps the rollup tables refreshed.
+
+    Run exactly one of these per database: `flask --app app rollups`.
+    """
+    setup_schema()
+    run_rollups()
+
+
+def make_packer(columns):
+    """
+    Builds a function that turns a row tuple into a dict keyed by `columns`.
+
+    The function body is generated as a dict literal with the column names and
+    indexes baked in, which is cheaper per row than dict(zip(columns, row)).
+    """
+    items = ', '.join(f"{column!r}: row[{i}]" for i, column in enumerate(columns))
+    namespace = {}
+    exec(f"def pack(row):\n    return {{{items}}}\n", namespace)
+    return namespace['pack']
+
+
+# Columns of the raw tables, selected explicitly in the order listed
+TEMP_COLS = ('id', 'timestamp', 'temperature')
+MOTION_COLS = ('id', 'timestamp', 'motion_detected')
+PACK_TEMP = make_packer(TEMP_COLS)
+PACK_MOTION = make_packer(MOTION_COLS)
+
+# SQL used by the route handlers, one shared constant per query. Values are
+# always bound as parameters, never formatted into the statement text.
+Q_TEMP_LATEST = 'SELECT id, timestamp, temperature FROM temperature ORDER BY timestamp DESC LIMIT 100'
+Q_MOTION_LATEST = 'SELECT id, timestamp, motion_detected FROM motion ORDER BY timestamp DESC LIMIT 100'
+Q_TEMP_DAILY_AVG = """
+    SELECT date, sum_temp * 1.0 / n as average_temp
+    FROM temperature_daily
+    ORDER BY date DESC
+"""
+Q_TEMP_WEEKLY_AVG = """
+    SELECT STRFTIME('%Y-%W', date) as week, SUM(sum_temp) * 1.0 / SUM(n) as average_temp
+    FROM temperature_daily
+    GROUP BY STRFTIME('%Y-%W', date)
+    ORDER BY week DESC
+"""
+Q_TEMP_MONTHLY_AVG = """
+    SELECT SUBSTR(date, 1, 7) as month, SUM(sum_temp) * 1.0 / SUM(n) as average_temp
+    FROM temperature_daily
+    GROUP BY SUBSTR(date, 1, 7)
+    ORDER BY month DESC
+"""
+Q_MOTION_BY_DAY = """
+    SELECT SUBSTR(hour, 1, 10) as date, SUM(cnt) as motion_count
+    FROM motion_hourly
+    GROUP BY SUBSTR(hour, 1, 10)
+    ORDER BY date DESC
+"""
+Q_MOTION_BY_HOUR = """
+    SELECT SUBSTR(hour, 12, 2) as hour, SUM(cnt) as motion_count
+    FROM motion_hourly
+    GROUP BY SUBSTR(hour, 12, 2)
+    ORDER BY SUBSTR(hour, 12, 2) ASC
+"""
+Q_MOTION_BY_WEEK = """
+    SELECT STRFTIME('%Y-%W', SUBSTR(hour, 1, 10)) as week, SUM(cnt) as motion_count
+    FROM motion_hourly
+    GROUP BY STRFTIME('%Y-%W', SUBSTR(hour, 1, 10))
+    ORDER BY week DESC
+"""
+Q_TEMP_RANGE = """
+    SELECT id, timestamp, temperature FROM temperature
+    WHERE timestamp BETWEEN ? AND ?
+    ORDER BY timestamp DESC
+"""
+Q_MOTION_RANGE = """
+    SELECT id, timestamp, motion_detected FROM motion
+    WHERE timestamp BETWEEN ? AND ?
+    ORDER BY timestamp DESC
+"""
+Q_TEMP_PEAK = 'SELECT id, timestamp, temperature FROM temperature ORDER BY temperature DESC, id ASC LIMIT 1'
+Q_MOTION_PEAK = """
+    SELECT SUBSTR(hour, 1, 10) as date, SUM(cnt) as motion_count
+    FROM motion_hourly
+    GROUP BY SUBSTR(hour, 1, 10)
+    ORDER BY motion_count DESC, date DESC LIMIT 1
+"""
+
+# Summary statistics are computed in a single round-trip each. The min/max
+# and peak lookups are index seeks on the live table, while the averages come
+# from the rollups and so can trail them by up to ROLLUP_INTERVAL seconds.
+# Ties for the peak resolve the same way as the /peak endpoints.
+TEMP_SUMMARY_COLS = ('min_temp', 'max_temp', 'average_temp', 'peak_id', 'peak_timestamp')
+Q_TEMP_SUMMARY = """
+    SELECT
+        (SELECT MIN(temperature) FROM temperature) as min_temp,
+        (SELECT MAX(temperature) FROM temperature) as max_temp,
+        (SELECT SUM(sum_temp) * 1.0 / SUM(n) FROM temperature_daily) as average_temp,
+        (SELECT id FROM temperature ORDER BY temperature DESC, id ASC LIMIT 1) as peak_id,
+        (SELECT timestamp FROM temperature ORDER BY temperature DESC, id ASC LIMIT 1) as peak_timestamp
+"""
+MOTION_SUMMARY_COLS = ('total_events', 'average_per_day', 'peak_date', 'peak_count')
+PACK_TEMP_SUMMARY = make_packer(TEMP_SUMMARY_COLS)
+PACK_MOTION_SUMMARY = make_packer(MOTION_SUMMARY_COLS)
+Q_MOTION_SUMMARY = """
+    WITH daily AS (
+        SELECT SUBSTR(hour, 1, 10) as date, SUM(cnt) as motion_count
+        FROM motion_hourly
+        GROUP BY SUBSTR(hour, 1, 10)
+    )
+    SELECT
+        SUM(motion_count) as total_events,
+        AVG(motion_count) as average_per_day,
+        (SELECT date FROM daily ORDER BY motion_count DESC, date DESC LIMIT 1) as peak_date,
+        MAX(motion_count) as peak_count
+    FROM daily
+"""
+
+
+def _execute(conn, query, params=()):
+    """
+    Runs a query on a fresh cursor, always binding parameters separately.
+    """
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    return cursor
+
+
+def _canonical_date(value, parsed):
+    """
+    Re-renders a parsed date in a canonical form, keeping the client's layout.
+
+    Input with no time part stays YYYY-MM-DD. Anything carrying a time is
+    rendered as a full datetime, using ' ' if the client separated date and
+    time with a space and 'T' otherwise, so the string comparison against
+    stored timestamps never drops the time the client asked for.
+    """
+    value = value.strip()
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
+    return parsed.isoformat(sep=' ' if ' ' in value else 'T')
+
+
+def parse_date_range(start_date, end_date):
+    """
+    Validates a start/end date pair and returns it in canonical form.
+
+    Accepts ISO 8601 dates or datetimes. Raises ValueError with a client
+    facing message if a date is malformed, the range is reversed, or it spans
+    more than MAX_RANGE_DAYS days.
+    """
+    try:
+        start = datetime.fromisoformat(start_date)
+        end = datetime.fromisoformat(end_date)
+    except ValueError:
+        raise ValueError('Dates must be ISO 8601 dates or datetimes '
+                         '(YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)') from None
+    if start.tzinfo or end.tzinfo:
+        raise ValueError('Dates must not include a timezone offset')
+    if end < start:
+        raise ValueError('End date must not be before start date')
+    if end - start > timedelta(days=MAX_RANGE_DAYS):
+        raise ValueError(f'Date range must not exceed {MAX_RANGE_DAYS} days')
+    return _canonical_date(start_date, start), _canonical_date(end_date, end)
+
+
+def run_summary(conn, query, pack):
+    """
+    Runs a single-row summary query and returns it packed into a dict.
+    """
+    row = _execute(conn, query).fetchone()
+    return pack(row)
+
+
+# Summaries cost an OpenAI call, so they are kept much longer than the
+# aggregate responses. Generation is sampled (temperature=0.7), so this
+# means a repeated payload gets the same summary back until it expires,
+# not that a fresh call would produce the same text.
+SUMMARY_CACHE_TIMEOUT = int(os.getenv('SUMMARY_CACHE_TIMEOUT', 3600))
+# In-process copy in front of the shared cache. Its short TTL bounds how far
+# a worker can serve a summary past the shared entry's expiry.
+SUMMARY_LRU_SIZE = 256
+SUMMARY_LRU_TTL = int(os.getenv('SUMMARY_LRU_TTL', 60))
+
+# System message sent with every /summarize request
+SYSTEM_PROMPT = {"role": "system", "content": """You are an AI assistant specialized in summarizing environmental data. Your task is to provide a concise, well-structured summary of the given environmental data. Please follow these guidelines:
+
+1. Start with a brief overview of the data period and types of measurements included.
+2. Provide key statistics:
+   - Average temperature (if available)
+   - Total number of motion events (if available)
+   - Any other relevant aggregate data
+3. Identify and mention any notable patterns or anomalies in the data.
+4. Format the summary in easy-to-read paragraphs with appropriate line breaks.
+5. Use bullet points for listing key points or statistics when appropriate.
+6. End with a brief conclusion or recommendation based on the data.
+
+Ensure that your response is well-formatted and easily readable when returned through an API."""}
+SUMMARY_PROMPT_PREFIX = "Please provide a brief, well-structured summary of the following environmental data:\n\n"
+
+_SSE_DONE = 'event: done\ndata: \n\n'
+
+
+def _sse(text):
+    """
+    Formats text as one Server-Sent Event, keeping embedded newlines.
+    """
+    return ''.join(f"data: {line}\n" for line in text.split('\n')) + '\n'
+
+
+def _stream_summary(completion, cache_key):
+    """
+    Relays a streamed OpenAI completion as Server-Sent Events.
+
+    The full summary is cached once the stream completes, so later requests
+    for the same data are served without calling OpenAI. If OpenAI fails
+    mid-stream the headers are already sent, so the failure is reported as
+    an "event: error" frame and nothing is cached.
+    """
+    parts = []
+    try:
+        for chunk in completion:
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
+                parts.append(text)
+                yield _sse(text)
+    except Exception as e:
+        yield 'event: error\n' + _sse(str(e))
+        return
+    cache.set(cache_key, ''.join(parts).strip(), timeout=SUMMARY_CACHE_TIMEOUT)
+    yield _SSE_DONE
+
+
+def _summary_cache_key(blob):
+    """
+    Returns the shared cache key for a canonically encoded /summarize payload.
+    """
+    return 'summary:' + hashlib.sha256(blob).hexdigest()
+
+
+def _create_completion(data_str, stream):
+    """
+    Asks OpenAI to summarize the given JSON-encoded data.
+    """
+    # Prepare the messages for OpenAI
+    messages = [
+        SYSTEM_PROMPT,
+        {"role": "user", "content": f"{SUMMARY_PROMPT_PREFIX}{data_str}"},
+    ]
+
+    # Make a request to the OpenAI API
+    return client.chat.completions.create(
+        model="gpt-4o-mini-2024-07-18",  # or another appropriate model
+        messages=messages,
+        max_tokens=650,
+        n=1,
+        temperature=0.7,
+        stream=stream,
+    )
+
+
+# Keyed on the payload digest so entries never hold on to client bodies
+@cached(TTLCache(maxsize=SUMMARY_LRU_SIZE, ttl=SUMMARY_LRU_TTL),
+        key=_summary_cache_key, lock=threading.Lock())
+def _summarize(blob):
+    """
+    Returns the summary for a canonically encoded payload.
+
+    Results are memoized in-process for SUMMARY_LRU_TTL seconds, keyed by the
+    payload's SHA-256 digest, in front of the shared Flask-Caching entry
+    (which also covers other workers and the streaming path when a Redis
+    backend is configured). Failed OpenAI calls are not cached.
+    """
+    cache_key = _summary_cache_key(blob)
+    summary = cache.get(cache_key)
+    if summary is None:
+        completion = _create_completion(blob.decode('utf-8'), stream=False)
+        # Extract the summary from the response
+        summary = completion.choices[0].message.content.strip()
+        cache.set(cache_key, summary, timeout=SUMMARY_CACHE_TIMEOUT)
+    return summary
+
 
 @app.route('/summarize', methods=['POST'])
 def get_summary():
@@ -106,6 +869,11 @@ def get_summary():
         "summary": <summary_text>
     }
 
+    If the request sends "Accept: text/event-stream", the summary is instead
+    streamed as Server-Sent Events while OpenAI generates it: one "data:"
+    event per text fragment, followed by an "event: done" event (or an
+    "event: error" event carrying the message if generation fails).
+
     Returns:
     - 200 OK: On successful summary generation.
     - 400 Bad Request: If no data is provided.
@@ -116,40 +884,23 @@ def get_summary():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        # Convert data to a string format
-        data_str = json.dumps(data, indent=2)
-
-        # Prepare the messages for OpenAI
-        messages = [
-        {"role": "system", "content": """You are an AI assistant specialized in summarizing environmental data. Your task is to provide a concise, well-structured summary of the given environmental data. Please follow these guidelines:
-
-1. Start with a brief overview of the data period and types of measurements included.
-2. Provide key statistics:
-   - Average temperature (if available)
-   - Total number of motion events (if available)
-   - Any other relevant aggregate data
-3. Identify and mention any notable patterns or anomalies in the data.
-4. Format the summary in easy-to-read paragraphs with appropriate line breaks.
-5. Use bullet points for listing key points or statistics when appropriate.
-6. End with a brief conclusion or recommendation based on the data.
-
-Ensure that your response is well-formatted and easily readable when returned through an API."""},
-        {"role": "user", "content": f"Please provide a brief, well-structured summary of the following environmental data:\n\n{data_str}"}
-    ]
+        # Canonical compact encoding: fewer input tokens, and payloads that
+        # differ only in key order share a cache entry
+        blob = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
 
-        # Make a request to the OpenAI API
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini-2024-07-18",  # or another appropriate model
-            messages=messages,
-            max_tokens=650,
-            n=1,
-            temperature=0.7,
-        )
+        stream = request.accept_mimetypes.best == 'text/event-stream'
+        if not stream:
+            summary = _summarize(blob)
+            return jsonify({'summary': summary})
 
-        # Extract the summary from the response
-        summary = completion.choices[0].message.content.strip()
+        cache_key = _summary_cache_key(blob)
+        summary = cache.get(cache_key)
+        if summary is not None:
+            return Response(_sse(summary) + _SSE_DONE, mimetype='text/event-stream')
 
-        return jsonify({'summary': summary})
+        completion = _create_completion(blob.decode('utf-8'), stream=True)
+        return Response(stream_with_context(_stream_summary(completion, cache_key)),
+                        mimetype='text/event-stream')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -173,13 +924,10 @@ def get_temperature_data():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = 'SELECT * FROM temperature ORDER BY timestamp DESC LIMIT 100'
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            rows = _execute(conn, Q_TEMP_LATEST).fetchall()
+            results = [PACK_TEMP(row) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -203,17 +951,16 @@ def get_motion_data():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = 'SELECT * FROM motion ORDER BY timestamp DESC LIMIT 100'
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            rows = _execute(conn, Q_MOTION_LATEST).fetchall()
+            results = [PACK_MOTION(row) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/temperature/average/day', methods=['GET'])
+@coalesce
+@cached_response
 def get_daily_temperature_average():
     """
     Retrieves daily average temperature.
@@ -232,22 +979,18 @@ def get_daily_temperature_average():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT DATE(timestamp) as date, AVG(temperature) as average_temp
-            FROM temperature
-            GROUP BY DATE(timestamp)
-            ORDER BY DATE(timestamp) DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_TEMP_DAILY_AVG)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/temperature/average/week', methods=['GET'])
+@coalesce
+@cached_response
 def get_weekly_temperature_average():
     """
     Retrieves weekly average temperature.
@@ -266,22 +1009,18 @@ def get_weekly_temperature_average():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT STRFTIME('%Y-%W', timestamp) as week, AVG(temperature) as average_temp
-            FROM temperature
-            GROUP BY STRFTIME('%Y-%W', timestamp)
-            ORDER BY STRFTIME('%Y-%W', timestamp) DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_TEMP_WEEKLY_AVG)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/temperature/average/month', methods=['GET'])
+@coalesce
+@cached_response
 def get_monthly_temperature_average():
     """
     Retrieves monthly average temperature.
@@ -300,22 +1039,18 @@ def get_monthly_temperature_average():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT STRFTIME('%Y-%m', timestamp) as month, AVG(temperature) as average_temp
-            FROM temperature
-            GROUP BY STRFTIME('%Y-%m', timestamp)
-            ORDER BY STRFTIME('%Y-%m', timestamp) DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_TEMP_MONTHLY_AVG)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/motion/by-day', methods=['GET'])
+@coalesce
+@cached_response
 def get_motion_by_day():
     """
     Retrieves the count of motion events per day.
@@ -334,22 +1069,18 @@ def get_motion_by_day():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT DATE(timestamp) as date, COUNT(*) as motion_count
-            FROM motion
-            GROUP BY DATE(timestamp)
-            ORDER BY DATE(timestamp) DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_MOTION_BY_DAY)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/temperature/by-day', methods=['GET'])
+@coalesce
+@cached_response
 def get_temperature_by_day():
     """
     Retrieves the average temperature for each day.
@@ -368,22 +1099,18 @@ def get_temperature_by_day():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT DATE(timestamp) as date, AVG(temperature) as average_temp
-            FROM temperature
-            GROUP BY DATE(timestamp)
-            ORDER BY DATE(timestamp) DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_TEMP_DAILY_AVG)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/motion/by-hour', methods=['GET'])
+@coalesce
+@cached_response
 def get_motion_by_hour():
     """
     Retrieves motion count per hour.
@@ -402,22 +1129,18 @@ def get_motion_by_hour():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT STRFTIME('%H', timestamp) as hour, COUNT(*) as motion_count
-            FROM motion
-            GROUP BY STRFTIME('%H', timestamp)
-            ORDER BY STRFTIME('%H', timestamp) ASC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_MOTION_BY_HOUR)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/motion/by-week', methods=['GET'])
+@coalesce
+@cached_response
 def get_motion_by_week():
     """
     Retrieves the count of motion events per week.
@@ -436,18 +1159,12 @@ def get_motion_by_week():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT STRFTIME('%Y-%W', timestamp) as week, COUNT(*) as motion_count
-            FROM motion
-            GROUP BY STRFTIME('%Y-%W', timestamp)
-            ORDER BY STRFTIME('%Y-%W', timestamp) DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_MOTION_BY_WEEK)
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in rows]
+            return jsonify(results)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -459,6 +1176,8 @@ def get_temperature_in_range():
     Query Parameters:
     - start_date (required): Start of the date range in YYYY-MM-DD format.
     - end_date (required): End of the date range in YYYY-MM-DD format.
+      Either date may also be an ISO 8601 datetime without a timezone. The
+      range may span at most MAX_RANGE_DAYS days.
 
     Response JSON format:
     [
@@ -480,18 +1199,12 @@ def get_temperature_in_range():
         end_date = request.args.get('end_date')
         if not start_date or not end_date:
             return jsonify({'error': 'Start date and end date are required'}), 400
+        try:
+            start_date, end_date = parse_date_range(start_date, end_date)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-        cursor = conn.cursor()
-        query = """
-            SELECT * FROM temperature
-            WHERE timestamp BETWEEN ? AND ?
-            ORDER BY timestamp DESC
-        """
-        cursor.execute(query, (start_date, end_date))
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        return stream_json(Q_TEMP_RANGE, PACK_TEMP, (start_date, end_date))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -503,6 +1216,8 @@ def get_motion_in_range():
     Query Parameters:
     - start_date (required): Start of the date range in YYYY-MM-DD format.
     - end_date (required): End of the date range in YYYY-MM-DD format.
+      Either date may also be an ISO 8601 datetime without a timezone. The
+      range may span at most MAX_RANGE_DAYS days.
 
     Response JSON format:
     [
@@ -524,22 +1239,18 @@ def get_motion_in_range():
         end_date = request.args.get('end_date')
         if not start_date or not end_date:
             return jsonify({'error': 'Start date and end date are required'}), 400
+        try:
+            start_date, end_date = parse_date_range(start_date, end_date)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-        cursor = conn.cursor()
-        query = """
-            SELECT * FROM motion
-            WHERE timestamp BETWEEN ? AND ?
-            ORDER BY timestamp DESC
-        """
-        cursor.execute(query, (start_date, end_date))
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in rows]
-        return jsonify(results)
+        return stream_json(Q_MOTION_RANGE, PACK_MOTION, (start_date, end_date))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/temperature/peak', methods=['GET'])
+@coalesce
+@cached_response
 def get_peak_temperature():
     """
     Retrieves the record with the highest temperature.
@@ -556,17 +1267,16 @@ def get_peak_temperature():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = 'SELECT * FROM temperature ORDER BY temperature DESC LIMIT 1'
-        cursor.execute(query)
-        row = cursor.fetchone()
-        columns = [desc[0] for desc in cursor.description]
-        result = dict(zip(columns, row))
-        return jsonify(result)
+        with get_conn() as conn:
+            row = _execute(conn, Q_TEMP_PEAK).fetchone()
+            result = PACK_TEMP(row)
+            return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/data/motion/peak', methods=['GET'])
+@coalesce
+@cached_response
 def get_peak_motion():
     """
     Retrieves the day with the highest count of motion events.
@@ -582,21 +1292,75 @@ def get_peak_motion():
     - 500 Internal Server Error: If an error occurs during data retrieval.
     """
     try:
-        cursor = conn.cursor()
-        query = """
-            SELECT DATE(timestamp) as date, COUNT(*) as motion_count
-            FROM motion
-            GROUP BY DATE(timestamp)
-            ORDER BY COUNT(*) DESC LIMIT 1
-        """
-        cursor.execute(query)
-        row = cursor.fetchone()
-        columns = [desc[0] for desc in cursor.description]
-        result = dict(zip(columns, row))
-        return jsonify(result)
+        with get_conn() as conn:
+            cursor = _execute(conn, Q_MOTION_PEAK)
+            row = cursor.fetchone()
+            columns = [desc[0] for desc in cursor.description]
+            result = dict(zip(columns, row))
+            return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/data/temperature/summary', methods=['GET'])
+@coalesce
+@cached_response
+def get_temperature_summary():
+    """
+    Retrieves summary statistics for temperature.
+
+    Response JSON format:
+    {
+        "min_temp": <minimum_temperature>,
+        "max_temp": <maximum_temperature>,
+        "average_temp": <average_temperature>,
+        "peak_id": <record_id_of_highest_temperature>,
+        "peak_timestamp": <timestamp_of_highest_temperature>
+    }
+
+    min_temp, max_temp and the peak record are read from the live table;
+    average_temp comes from the daily rollup and may lag new readings by up
+    to ROLLUP_INTERVAL seconds.
+
+    Returns:
+    - 200 OK: On successful data retrieval.
+    - 500 Internal Server Error: If an error occurs during data retrieval.
+    """
+    try:
+        with get_conn() as conn:
+            result = run_summary(conn, Q_TEMP_SUMMARY, PACK_TEMP_SUMMARY)
+            return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/data/motion/summary', methods=['GET'])
+@coalesce
+@cached_response
+def get_motion_summary():
+    """
+    Retrieves summary statistics for motion events.
+
+    Response JSON format:
+    {
+        "total_events": <total_motion_events>,
+        "average_per_day": <average_motion_events_per_day>,
+        "peak_date": <date_with_most_motion_events>,
+        "peak_count": <motion_events_on_peak_date>
+    }
+
+    Returns:
+    - 200 OK: On successful data retrieval.
+    - 500 Internal Server Error: If an error occurs during data retrieval.
+    """
+    try:
+        with get_conn() as conn:
+            result = run_summary(conn, Q_MOTION_SUMMARY, PACK_MOTION_SUMMARY)
+            return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
+    # The development server does the rollup work in-process
+    setup_schema()
+    threading.Thread(target=run_rollups, daemon=True).start()
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port)
@@ -0,0 +1,23 @@
+-- Rollup tables kept up to date by refresh_rollups() in app.py.
+-- Aggregate endpoints read these instead of scanning the raw tables.
+
+-- One row per calendar day: sum and count, so averages can be re-aggregated
+-- into weeks and months without losing precision.
+CREATE TABLE IF NOT EXISTS temperature_daily (
+    date TEXT PRIMARY KEY,
+    sum_temp REAL NOT NULL,
+    n INTEGER NOT NULL
+);
+
+-- One row per clock hour, keyed as 'YYYY-MM-DD HH'.
+CREATE TABLE IF NOT EXISTS motion_hourly (
+    hour TEXT PRIMARY KEY,
+    cnt INTEGER NOT NULL
+);
+
+-- Highest source row id already folded into the rollups, per source table.
+-- Assumes temperature.id and motion.id are ever-increasing INTEGER PRIMARY KEYs.
+CREATE TABLE IF NOT EXISTS rollup_state (
+    name TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);